@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+
+# Use the proper idiom in the main module ...
+# NOTE: See https://docs.python.org/3.12/library/multiprocessing.html#the-spawn-and-forkserver-start-methods
+if __name__ == "__main__":
+    # Import standard modules ...
+    import argparse
+    import csv
+    import glob
+    import hashlib
+    import io
+    import json
+    import math
+    import os
+    import time
+    import zipfile
+
+    # Import special modules ...
+    try:
+        import cartopy
+        import cartopy.crs
+    except:
+        raise Exception("\"cartopy\" is not installed; run \"pip install --user Cartopy\"") from None
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+    try:
+        import shapefile
+    except:
+        raise Exception("\"shapefile\" is not installed; run \"pip install --user pyshp\"") from None
+
+    # Import my modules ...
+    import hffl
+
+    # **************************************************************************
+
+    # Create argument parser and parse the arguments ...
+    parser = argparse.ArgumentParser(
+           allow_abbrev = False,
+            description = "HFFL: calculate how much National Trust or Open Access land there is near to many sites.",
+        formatter_class = argparse.ArgumentDefaultsHelpFormatter,
+    )
+    parser.add_argument(
+        "--output",
+        default = "statistics.csv",
+           help = "the CSV (or Parquet, if it ends with \".parquet\") file to save the statistics to",
+           type = str,
+    )
+    parser.add_argument(
+        "--res",
+        default = 100.0,
+           help = "the resolution of the distance raster (in metres)",
+           type = float,
+    )
+    parser.add_argument(
+        "--sites",
+        default = "sites.csv",
+           help = "the CSV file of sites to load (with \"name\", \"lat\" and \"lon\" columns)",
+           type = str,
+    )
+    args = parser.parse_args()
+
+    # **************************************************************************
+
+    # Set number of buffers, the distance of each buffer and hence the largest
+    # buffer distance (which are shared between all scripts) ...
+    nDist = hffl.nDist                                                          # [#]
+    stepDist = hffl.stepDist                                                    # [m]
+    maxDist = hffl.maxDist                                                      # [m]
+
+    # Set the radius of the field-of-view ...
+    radius = 30.0e3                                                             # [m]
+
+    # Define distances ...
+    dists = [float(i + 1) * stepDist for i in range(nDist)]                     # [m]
+
+    # Define datasets (which are shared between all scripts) ...
+    dsets = hffl.dsets
+
+    # Check that the datasets have been downloaded ...
+    for dset in dsets:
+        if not os.path.exists(dset):
+            raise Exception(f"\"{dset}\" is missing; run \"howFarFromLand.py\" first") from None
+
+    # **************************************************************************
+
+    print(f"Loading \"{args.sites}\" ...")
+
+    # Initialize lists ...
+    names = []
+    lats = []
+    lons = []
+
+    # Load sites ...
+    with open(args.sites, "rt", encoding = "utf-8", newline = "") as fObj:
+        for row in csv.DictReader(fObj):
+            names.append(row["name"])
+            lats.append(float(row["lat"]))                                      # [°]
+            lons.append(float(row["lon"]))                                      # [°]
+
+    # Check that there are some sites ...
+    if not names:
+        raise Exception(f"\"{args.sites}\" does not contain any sites") from None
+
+    print(f"  INFO: {len(names):,d} sites were loaded")
+
+    # Convert from Longitudes/Latitudes to Eastings/Northings ...
+    pts = cartopy.crs.OSGB().transform_points(
+        cartopy.crs.PlateCarree(),
+        numpy.array(lons),
+        numpy.array(lats),
+    )
+    xs = pts[:, 0]                                                              # [m]
+    ys = pts[:, 1]                                                              # [m]
+
+    # Find the extent of the distance raster (covering the fields-of-view of
+    # all of the sites, and snapped to the resolution) ...
+    xmin = args.res * math.floor((xs.min() - radius) / args.res - 2.0)          # [m]
+    xmax = args.res * math.ceil((xs.max() + radius) / args.res + 2.0)           # [m]
+    ymin = args.res * math.floor((ys.min() - radius) / args.res - 2.0)          # [m]
+    ymax = args.res * math.ceil((ys.max() + radius) / args.res + 2.0)           # [m]
+
+    # **************************************************************************
+
+    # Deduce NPZ name from everything which determines the distance raster and
+    # check what needs doing ...
+    key = hashlib.sha256(
+        json.dumps(
+            [
+                [xmin, xmax, ymin, ymax],
+                args.res,
+                maxDist,
+                [(dset, os.path.getsize(dset), os.path.getmtime(dset)) for dset in dsets],
+            ]
+        ).encode("utf-8")
+    ).hexdigest()
+    fname = f"distanceRaster.{key[:16]}.npz"
+    if os.path.exists(fname):
+        print(f"Loading \"{fname}\" ...")
+
+        # Load distance raster ...
+        with numpy.load(fname) as data:
+            raster = data["raster"]                                             # [m]
+    else:
+        print(f"Saving \"{fname}\" ...")
+
+        # Initialize list ...
+        polys = []
+
+        # Loop over datasets ...
+        for dset, dstub in dsets.items():
+            print(f"  Loading \"{dset}\" ...")
+
+            # Load dataset ...
+            with zipfile.ZipFile(dset, "r") as zfObj:
+                # Read files into RAM so that they become seekable ...
+                # NOTE: https://stackoverflow.com/a/12025492
+                dbfObj = io.BytesIO(zfObj.read(f"{dstub}.dbf"))
+                shpObj = io.BytesIO(zfObj.read(f"{dstub}.shp"))
+                shxObj = io.BytesIO(zfObj.read(f"{dstub}.shx"))
+
+                # Open shapefile ...
+                sfObj = shapefile.Reader(dbf = dbfObj, shp = shpObj, shx = shxObj)
+
+                # Load all Polygons (in Eastings/Northings) from the shapefile
+                # which are close enough to the distance raster to matter ...
+                for poly in hffl.loadShapefileEN(sfObj):
+                    if poly.bounds[0] <= xmax + maxDist and poly.bounds[2] >= xmin - maxDist:
+                        if poly.bounds[1] <= ymax + maxDist and poly.bounds[3] >= ymin - maxDist:
+                            polys.append(poly)
+
+        print("  Rasterising data ...")
+
+        # Make distance raster ...
+        start = time.perf_counter()                                             # [s]
+        raster = hffl.makeDistanceRaster(polys, xmin, xmax, ymin, ymax, args.res, maxDist)  # [m]
+        dur = time.perf_counter() - start                                       # [s]
+
+        print(f"    INFO: {raster.size:,d} cells were rasterised in {dur:.1f} s")
+
+        # Remove any distance rasters from previous sites, resolutions or
+        # versions of the datasets ...
+        for oname in glob.glob("distanceRaster.*.npz"):
+            os.remove(oname)
+
+        # Save distance raster ...
+        numpy.savez_compressed(
+            fname,
+            raster = raster,
+        )
+
+    # **************************************************************************
+
+    print("Calculating statistics ...")
+
+    # Calculate statistics ...
+    start = time.perf_counter()                                                 # [s]
+    landAreas, bandAreas, fracs = hffl.coverageStatistics(
+        raster,
+        xmin,
+        ymin,
+        args.res,
+        xs,
+        ys,
+        dists,
+        radius = radius,
+    )                                                                           # [m²], [m²], [1]
+    dur = time.perf_counter() - start                                           # [s]
+
+    print(f"  INFO: {len(names):,d} sites took {dur:.3f} s ({float(len(names)) / max(dur, 1.0e-9):,.1f} sites/s)")
+
+    # **************************************************************************
+
+    print(f"Saving \"{args.output}\" ...")
+
+    # Create columns ...
+    cols = {
+                         "name" : names,
+                      "lat [°]" : lats,
+                      "lon [°]" : lons,
+        "access land area [m²]" : landAreas.tolist(),
+    }
+    for i, dist in enumerate(dists):
+        cols[f"area {0.001 * (dist - stepDist):.1f}-{0.001 * dist:.1f} km from access land [m²]"] = bandAreas[:, i].tolist()
+    for i, dist in enumerate(dists):
+        cols[f"fraction within {0.001 * dist:.1f} km of access land"] = fracs[:, i].tolist()
+
+    # Check what type of file needs saving ...
+    if args.output.endswith(".parquet"):
+        # Import special modules ...
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except:
+            raise Exception("\"pyarrow\" is not installed; run \"pip install --user pyarrow\"") from None
+
+        # Save Parquet ...
+        pyarrow.parquet.write_table(pyarrow.table(cols), args.output)
+    else:
+        # Save CSV ...
+        with open(args.output, "wt", encoding = "utf-8", newline = "") as fObj:
+            wObj = csv.writer(fObj)
+            wObj.writerow(cols.keys())
+            wObj.writerows(zip(*cols.values(), strict = True))
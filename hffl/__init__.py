@@ -1,6 +1,18 @@
 #!/usr/bin/env python3
 
+# Import constants ...
+from .constants import dsets, maxDist, nDist, stepDist
+
 # Import sub-functions ...
+from .changedBoxes import changedBoxes
+from .chooseLevel import chooseLevel
+from .coverageStatistics import coverageStatistics
 from .dump import dump
+from .hashShapefile import hashShapefile
+from .levelNames import levelNames
+from .loadBackground import loadBackground
 from .loadGeoJSON import loadGeoJSON
 from .loadShapefile import loadShapefile
+from .loadShapefileEN import loadShapefileEN
+from .makeDistanceRaster import makeDistanceRaster
+from .saveLevels import saveLevels
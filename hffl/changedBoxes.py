@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def changedBoxes(
+    oldHashes,
+    newHashes,
+    /,
+    *,
+    debug = __debug__,
+):
+    # Import special modules ...
+    try:
+        import shapely
+        import shapely.geometry
+    except:
+        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+    # Import my modules ...
+    try:
+        import pyguymer3
+        import pyguymer3.geo
+    except:
+        raise Exception("\"pyguymer3\" is not installed; run \"pip install --user PyGuymer3\"") from None
+
+    # Check arguments ...
+    if not isinstance(oldHashes, dict):
+        raise TypeError("\"oldHashes\" is not a dict")
+    if not isinstance(newHashes, dict):
+        raise TypeError("\"newHashes\" is not a dict")
+
+    # Initialize counter and list ...
+    n = 0                                                                       # [#]
+    boxes = []
+
+    # Loop over records which have either been removed from the old version or
+    # added in the new version (a modified record appears as both) ...
+    for key in set(oldHashes.keys()) ^ set(newHashes.keys()):
+        # Find the bounding box (in Eastings/Northings) of this record ...
+        bbox = oldHashes[key] if key in oldHashes else newHashes[key]           # [m], [m], [m], [m]
+
+        # Convert from Eastings/Northings to Longitudes/Latitudes ...
+        poly = pyguymer3.geo.en2ll(
+            shapely.geometry.box(*bbox),
+            debug = debug,
+        )
+        if poly is False:
+            print(f"WARNING: Skipping a changed record as its bounding box could not be converted from Eastings/Northings to Longitudes/Latitudes ({repr(bbox)}).")
+            n += 1                                                              # [#]
+            continue
+
+        # Append bounding box (in Longitudes/Latitudes) to list ...
+        boxes.append(poly.bounds)                                               # [°], [°], [°], [°]
+
+    print(f"  INFO: {n:,d} changed records were skipped because their bounding boxes could not be converted")
+
+    # Return answer ...
+    return boxes
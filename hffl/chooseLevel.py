@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def chooseLevel(
+    fname,
+    lods,
+    tol,
+    /,
+    *,
+    units = "degrees",
+):
+    # Import standard modules ...
+    import math
+    import os
+
+    # Import my modules ...
+    from .levelNames import levelNames
+
+    # Check argument ...
+    if not isinstance(lods, list):
+        raise TypeError("\"lods\" is not a list")
+
+    # Convert the tolerance to degrees (if needed) ...
+    match units:
+        case "degrees":
+            pass
+        case "metres":
+            tol = math.degrees(tol / 6371.0e3)                                  # [°]
+        case _:
+            # Crash ...
+            raise ValueError(f"\"units\" is an unexpected value ({repr(units)})") from None
+
+    # Loop over levels (from coarsest to finest) ...
+    for lod, lname in sorted(zip(lods, levelNames(fname, lods), strict = True), reverse = True):
+        # Skip this level if it is coarser than the tolerance ...
+        if lod > tol:
+            continue
+
+        # Return the GeoJSON name if it exists ...
+        if os.path.exists(lname):
+            return lname
+
+    # Return the full detail GeoJSON name ...
+    return fname
@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+
+# Define datasets (and the stub of the shapefile within each ZIP file) ...
+dsets = {
+      "alwaysOpen.zip" : "d00dbcdd-ca42-4b51-9889-50627184f7602020313-1-1rdxbnd.c0er",
+    "limitedAccess.zip" : "9a97e056-3bd9-4817-a9c5-ad7de1f31a1d2020313-1-rlrdj0.1jac",
+       "openAccess.zip" : "CRoW_Access_Land___Natural_England",
+}
+
+# Set number of buffers, the distance of each buffer and hence the largest
+# buffer distance ...
+nDist = 6                                                                       # [#]
+stepDist = 500.0                                                                # [m]
+maxDist = float(nDist) * stepDist                                               # [m]
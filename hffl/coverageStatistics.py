@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def coverageStatistics(
+    raster,
+    xmin,
+    ymin,
+    res,
+    xs,
+    ys,
+    dists,
+    /,
+    *,
+    radius = 30.0e3,
+):
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+
+    # Check argument ...
+    if not isinstance(raster, numpy.ndarray):
+        raise TypeError("\"raster\" is not a NumPy array")
+
+    # Find the size of the raster ...
+    ny, nx = raster.shape                                                       # [#], [#]
+
+    # Find the number of cells either side of a site which are needed to cover
+    # the field-of-view ...
+    n = int(numpy.ceil(radius / res))                                           # [#]
+
+    # Find the cell which contains each site (the field-of-view of a site is
+    # centred on the centre of its cell) and check that the whole
+    # field-of-view is within the raster (otherwise it would be silently cut
+    # off at the edge) ...
+    ix = numpy.floor((numpy.asarray(xs) - xmin) / res).astype(numpy.int64)      # [#]
+    iy = numpy.floor((numpy.asarray(ys) - ymin) / res).astype(numpy.int64)      # [#]
+    if ix.min() - n < 0 or ix.max() + n >= nx or iy.min() - n < 0 or iy.max() + n >= ny:
+        raise Exception("the field-of-view of at least one site is not within the raster") from None
+
+    # Make the kernel of the cells which are within the field-of-view of the
+    # cell at its centre ...
+    off = res * numpy.arange(-n, n + 1, dtype = numpy.float64)                  # [m]
+    kernel = (numpy.hypot(off[numpy.newaxis, :], off[:, numpy.newaxis]) <= radius).astype(numpy.float64)
+
+    # Find the true area of the cells in every column (the OSGB grid is a
+    # Transverse Mercator projection, so the area of a cell on the ground is
+    # its area on the grid divided by the square of the scale factor, which
+    # only depends on the Easting) ...
+    e = xmin + res * (numpy.arange(nx, dtype = numpy.float64) + 0.5)            # [m]
+    k = 0.9996012717 * (1.0 + numpy.square(e - 400000.0) / (2.0 * numpy.square(6381.0e3)))   # [1]
+    areas = res * res / numpy.square(k)                                         # [m²]
+
+    # Find the shape of the FFTs (padded so that the convolution does not wrap
+    # around) and the FFT of the kernel ...
+    shape = (ny + 2 * n, nx + 2 * n)                                            # [#], [#]
+    kfft = numpy.fft.rfft2(kernel, s = shape)
+
+    # Define a function which convolves a raster with the kernel and samples
+    # the result at the cell of each site ...
+    def convolveAtSites(layer):
+        full = numpy.fft.irfft2(numpy.fft.rfft2(layer, s = shape) * kfft, s = shape)
+        return numpy.maximum(full[iy + n, ix + n], 0.0)
+
+    # Find the true area of the field-of-view of each site ...
+    fovAreas = convolveAtSites(numpy.broadcast_to(areas, (ny, nx)))             # [m²]
+
+    # Create the upper edges of the distance bands (starting with the access
+    # land itself) ...
+    edges = [0.0] + list(dists)                                                 # [m]
+
+    # Initialize array ...
+    tots = numpy.zeros((len(xs), len(edges)), dtype = numpy.float64)            # [m²]
+
+    # Loop over edges ...
+    for i, edge in enumerate(edges):
+        # Sum the true areas of the cells within the field-of-view of each site
+        # which are within this distance of access land ...
+        tots[:, i] = convolveAtSites(numpy.where(raster <= edge, areas[numpy.newaxis, :], 0.0))    # [m²]
+
+    # Convert the cumulative areas to the statistics ...
+    landAreas = tots[:, 0]                                                      # [m²]
+    bandAreas = numpy.diff(tots, axis = 1)                                      # [m²]
+    fracs = tots[:, 1:] / fovAreas[:, numpy.newaxis]                            # [1]
+
+    # Return answer ...
+    return landAreas, bandAreas, fracs
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def hashShapefile(
+    sfObj,
+    /,
+):
+    # Import standard modules ...
+    import hashlib
+    import json
+
+    # Import special modules ...
+    try:
+        import shapefile
+    except:
+        raise Exception("\"shapefile\" is not installed; run \"pip install --user pyshp\"") from None
+
+    # Check argument ...
+    if not isinstance(sfObj, shapefile.Reader):
+        raise TypeError("\"sfObj\" is not a shapefile.Reader")
+
+    # Initialize dictionary ...
+    hashes = {}
+
+    # Loop over shape+record pairs ...
+    for shapeRecord in sfObj.iterShapeRecords():
+        # Create hash object ...
+        hObj = hashlib.sha256()
+
+        # Add the geometry and the attributes of this shape+record to the hash
+        # object ...
+        hObj.update(json.dumps(list(shapeRecord.shape.parts)).encode("utf-8"))
+        hObj.update(json.dumps(shapeRecord.shape.points).encode("utf-8"))
+        hObj.update(json.dumps(list(shapeRecord.record), default = str).encode("utf-8"))
+
+        # Save the bounding box (in Eastings/Northings) of this shape+record ...
+        hashes[hObj.hexdigest()] = list(shapeRecord.shape.bbox)                 # [m], [m], [m], [m]
+
+    # Return answer ...
+    return hashes
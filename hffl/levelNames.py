@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def levelNames(
+    fname,
+    lods,
+    /,
+):
+    # Check argument ...
+    if not isinstance(lods, list):
+        raise TypeError("\"lods\" is not a list")
+
+    # Return answer (naming each level by its degree of simplification, so
+    # that a level is never reused for a different degree of simplification) ...
+    return [f"{fname.removesuffix('.geojson')}.lod{lod:g}.geojson" for lod in lods]
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def loadBackground(
+    ax,
+    iname,
+    iextent,
+    stub,
+    /,
+    *,
+    regrid_shape = 750,
+):
+    # Import standard modules ...
+    import glob
+    import hashlib
+    import json
+    import math
+    import os
+
+    # Import special modules ...
+    try:
+        import cartopy
+        import cartopy.crs
+        import cartopy.img_transform
+    except:
+        raise Exception("\"cartopy\" is not installed; run \"pip install --user Cartopy\"") from None
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+    try:
+        import PIL
+        import PIL.Image
+    except:
+        raise Exception("\"PIL\" is not installed; run \"pip install --user Pillow\"") from None
+
+    # Find the fingerprint of the image and the extent of the axis (in the
+    # projection of the axis) ...
+    fingerprint = [iname, os.path.getsize(iname), os.path.getmtime(iname)]     # [B], [s]
+    xmin, xmax, ymin, ymax = ax.get_extent()
+
+    # Deduce NPZ name from everything which determines the reprojected image
+    # and check if it has been made before ...
+    key = hashlib.sha256(
+        json.dumps(
+            [
+                fingerprint,
+                list(iextent),
+                [xmin, xmax, ymin, ymax],
+                regrid_shape,
+                ax.projection.proj4_init,
+            ]
+        ).encode("utf-8")
+    ).hexdigest()
+    cname = f"{stub}.bg.{key[:16]}.npz"
+    if os.path.exists(cname):
+        # Load the reprojected image, its mask and its extent ...
+        with numpy.load(cname) as data:
+            img = data["img"]
+            mask = data["mask"]
+            extent = data["extent"].tolist()                                    # [m], [m], [m], [m]
+
+        # Convert the image to floats between 0 and 1 (with the masked pixels
+        # as NaNs, which are drawn transparently) ...
+        img = img.astype(numpy.float32) / 255.0
+        img[mask] = numpy.nan
+
+        # Return answer ...
+        return img, extent
+
+    # **************************************************************************
+    # *           STEP 1: CONVERT THE IMAGE TO A MEMORY-MAPPED ARRAY           *
+    # **************************************************************************
+
+    # Deduce NPY name from the fingerprint of the image and check if it needs
+    # making ...
+    # NOTE: PNGs cannot be read a window at a time, so the image is decoded in
+    #       full once and saved as a raw array which can be memory-mapped.
+    iroot = os.path.basename(iname).rsplit(".", maxsplit = 1)[0]
+    iarr = f"{iroot}.{hashlib.sha256(json.dumps(fingerprint).encode('utf-8')).hexdigest()[:16]}.npy"
+    if not os.path.exists(iarr):
+        # Remove any arrays made from previous versions of the image ...
+        for fname in glob.glob(f"{iroot}.*.npy"):
+            os.remove(fname)
+
+        # Decode the image as 8-bit greyscale (so that palette images are
+        # converted to grey levels) and save it ...
+        with PIL.Image.open(iname) as iObj:
+            numpy.save(iarr, numpy.asarray(iObj.convert("L")))
+
+    # Memory-map the image (so that only the rows of the window are read) ...
+    src = numpy.load(iarr, mmap_mode = "r")
+
+    # **************************************************************************
+    # *                  STEP 2: FIND THE WINDOW OF THE IMAGE                  *
+    # **************************************************************************
+
+    # Create points around the edge of the axis and convert them to
+    # Eastings/Northings ...
+    xs = numpy.concatenate(
+        [
+            numpy.linspace(xmin, xmax, num = 101),
+            numpy.full(101, xmax),
+            numpy.linspace(xmax, xmin, num = 101),
+            numpy.full(101, xmin),
+        ]
+    )                                                                           # [m]
+    ys = numpy.concatenate(
+        [
+            numpy.full(101, ymin),
+            numpy.linspace(ymin, ymax, num = 101),
+            numpy.full(101, ymax),
+            numpy.linspace(ymax, ymin, num = 101),
+        ]
+    )                                                                           # [m]
+    pts = cartopy.crs.OSGB().transform_points(ax.projection, xs, ys)
+    emin, emax = pts[:, 0].min(), pts[:, 0].max()                               # [m], [m]
+    nmin, nmax = pts[:, 1].min(), pts[:, 1].max()                               # [m], [m]
+
+    # Find the size of the image and of its pixels ...
+    ny, nx = src.shape                                                          # [px], [px]
+    dx = (iextent[1] - iextent[0]) / float(nx)                                  # [m/px]
+    dy = (iextent[3] - iextent[2]) / float(ny)                                  # [m/px]
+
+    # Find the window of pixels (with a 2 pixel border) which covers the axis ...
+    col0 = max(0, math.floor((emin - iextent[0]) / dx) - 2)                     # [px]
+    col1 = min(nx, math.ceil((emax - iextent[0]) / dx) + 2)                     # [px]
+    row0 = max(0, math.floor((iextent[3] - nmax) / dy) - 2)                     # [px]
+    row1 = min(ny, math.ceil((iextent[3] - nmin) / dy) + 2)                     # [px]
+    if col0 >= col1 or row0 >= row1:
+        raise Exception(f"the axis does not overlap \"{iname}\"") from None
+
+    # Read only the window of the image and convert it to floats between 0 and
+    # 1 (like "matplotlib.pyplot.imread()" does) ...
+    img = numpy.array(src[row0:row1, col0:col1], dtype = numpy.float32) / 255.0
+    del src
+
+    # Find the extent of the window ...
+    cextent = [
+        iextent[0] + float(col0) * dx,
+        iextent[0] + float(col1) * dx,
+        iextent[3] - float(row1) * dy,
+        iextent[3] - float(row0) * dy,
+    ]                                                                           # [m], [m], [m], [m]
+
+    # **************************************************************************
+    # *                     STEP 3: REPROJECT THE WINDOW                       *
+    # **************************************************************************
+
+    # Reproject the window into the projection of the axis (remembering that
+    # the regridding assumes that the origin of the image is "lower") ...
+    img, extent = cartopy.img_transform.warp_array(
+        img[::-1],
+        ax.projection,
+              source_proj = cartopy.crs.OSGB(),
+               target_res = regrid_shape,
+            source_extent = cextent,
+            target_extent = [xmin, xmax, ymin, ymax],
+        mask_extrapolated = True,
+    )
+    mask = numpy.ma.getmaskarray(img)
+    img = numpy.ma.filled(img, 0.0)
+    extent = list(extent)                                                       # [m], [m], [m], [m]
+
+    # Remove any reprojected images of this location from previous views or
+    # resolutions ...
+    for fname in glob.glob(f"{stub}.bg.*.npz"):
+        os.remove(fname)
+
+    # Save the reprojected image (as 8-bit greyscale, which is what the source
+    # image is), its mask and its extent ...
+    numpy.savez_compressed(
+        cname,
+           img = numpy.round(255.0 * img).astype(numpy.uint8),
+          mask = mask,
+        extent = numpy.array(extent),
+    )
+
+    # Replace the masked pixels with NaNs (which are drawn transparently) ...
+    img = img.astype(numpy.float32)
+    img[mask] = numpy.nan
+
+    # Return answer ...
+    return img, extent
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def loadShapefileEN(
+    sfObj,
+    /,
+):
+    # Import special modules ...
+    try:
+        import shapefile
+    except:
+        raise Exception("\"shapefile\" is not installed; run \"pip install --user pyshp\"") from None
+    try:
+        import shapely
+        import shapely.geometry
+        import shapely.validation
+    except:
+        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+    # Check argument ...
+    if not isinstance(sfObj, shapefile.Reader):
+        raise TypeError("\"sfObj\" is not a shapefile.Reader")
+
+    # Initialize counter and list ...
+    n = 0                                                                       # [#]
+    polys1 = []
+
+    # Loop over shape+record pairs ...
+    for shapeRecord in sfObj.iterShapeRecords():
+        # Crash if this shape+record is not a shapefile polygon ...
+        if shapeRecord.shape.shapeType != shapefile.POLYGON:
+            raise Exception("\"shape\" is not a POLYGON") from None
+
+        # Convert shapefile.Shape to shapely.geometry.polygon.Polygon or
+        # shapely.geometry.multipolygon.MultiPolygon ...
+        poly1 = shapely.geometry.shape(shapeRecord.shape)
+        if not poly1.is_valid:
+            print(f"WARNING: Skipping a shape as it is not valid ({shapely.validation.explain_validity(poly1)}).")
+            n += 1                                                              # [#]
+            continue
+        if poly1.is_empty:
+            n += 1                                                              # [#]
+            continue
+
+        # Check if it is a [Multi]Polygon ...
+        match poly1:
+            case shapely.geometry.polygon.Polygon():
+                # Append to list ...
+                polys1.append(poly1)
+            case shapely.geometry.multipolygon.MultiPolygon():
+                # Loop over Polygons ...
+                for poly2 in poly1.geoms:
+                    # Append to list ...
+                    polys1.append(poly2)
+            case _:
+                # Crash
+                raise TypeError(f"\"poly1\" is an unexpected type ({repr(type(poly1))})") from None
+
+    print(f"      INFO: {n:,d} records were skipped because they were invalid")
+
+    # Return answer ...
+    return polys1
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def makeDistanceRaster(
+    polys,
+    xmin,
+    xmax,
+    ymin,
+    ymax,
+    res,
+    maxDist,
+    /,
+    *,
+    chunk = 1000000,
+):
+    # Import special modules ...
+    try:
+        import numpy
+    except:
+        raise Exception("\"numpy\" is not installed; run \"pip install --user numpy\"") from None
+    try:
+        import shapely
+    except:
+        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+    # Check argument ...
+    if not isinstance(polys, list):
+        raise TypeError("\"polys\" is not a list")
+
+    # Find the size of the raster ...
+    nx = round((xmax - xmin) / res)                                             # [#]
+    ny = round((ymax - ymin) / res)                                             # [#]
+
+    # Create the spatial index of the Polygons ...
+    tree = shapely.STRtree(polys)
+
+    # Initialize array (cells which are further than the maximum distance from
+    # any Polygon are left as infinity) ...
+    dists = numpy.full(nx * ny, numpy.inf, dtype = numpy.float32)               # [m]
+
+    # Find the coordinates of the centre of every cell ...
+    xs = xmin + res * (numpy.arange(nx, dtype = numpy.float64) + 0.5)           # [m]
+    ys = ymin + res * (numpy.arange(ny, dtype = numpy.float64) + 0.5)           # [m]
+
+    # Loop over chunks of cells (to limit the memory used by the Points) ...
+    for i0 in range(0, nx * ny, chunk):
+        i1 = min(nx * ny, i0 + chunk)
+
+        # Make Points at the centres of the cells in this chunk ...
+        ind = numpy.arange(i0, i1)
+        pnts = shapely.points(xs[ind % nx], ys[ind // nx])
+
+        # Find the distance from each Point to the nearest Polygon (a Point
+        # within a Polygon has a distance of zero) ...
+        (iPnt, _), dist = tree.query_nearest(
+            pnts,
+                max_distance = maxDist,
+             return_distance = True,
+        )                                                                       # [#], [#], [m]
+
+        # Save the shortest distance for each cell (a Point which is
+        # equidistant from more than one Polygon appears more than once) ...
+        numpy.minimum.at(dists, i0 + iPnt, dist.astype(numpy.float32))
+
+    # Return answer ...
+    return dists.reshape(ny, nx)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+
+# Define function ...
+def saveLevels(
+    fname,
+    lods,
+    /,
+    *,
+    debug = __debug__,
+):
+    # Import standard modules ...
+    import glob
+    import os
+    import time
+
+    # Import special modules ...
+    try:
+        import geojson
+    except:
+        raise Exception("\"geojson\" is not installed; run \"pip install --user geojson\"") from None
+    try:
+        import shapely
+    except:
+        raise Exception("\"shapely\" is not installed; run \"pip install --user Shapely\"") from None
+
+    # Import my modules ...
+    from .levelNames import levelNames
+    from .loadGeoJSON import loadGeoJSON
+
+    # Check argument ...
+    if not isinstance(lods, list):
+        raise TypeError("\"lods\" is not a list")
+
+    # Load the full detail GeoJSON (and time how long it takes) ...
+    start = time.perf_counter()                                                 # [s]
+    multipoly = loadGeoJSON(
+        fname,
+            debug = debug,
+        onlyValid = True,
+           repair = True,
+    )
+    dur0 = time.perf_counter() - start                                          # [s]
+
+    print(f"      INFO: level 0 (full detail) has {shapely.get_num_coordinates(multipoly):,d} coordinates, is {os.path.getsize(fname):,d} bytes and takes {dur0:.3f} s to load")
+
+    # Remove any levels which were made with different degrees of
+    # simplification ...
+    for lname in glob.glob(f"{fname.removesuffix('.geojson')}.lod*.geojson"):
+        if lname not in levelNames(fname, lods):
+            os.remove(lname)
+
+    # Loop over levels ...
+    for i, (lod, lname) in enumerate(zip(lods, levelNames(fname, lods), strict = True)):
+        # Simplify the full detail [Multi]Polygon (whilst preserving its
+        # topology so that no Polygons are made invalid) ...
+        multipolyLod = multipoly.simplify(lod, preserve_topology = True)
+
+        # Save GeoJSON ...
+        with open(lname, "wt", encoding = "utf-8") as fObj:
+            geojson.dump(
+                multipolyLod,
+                fObj,
+                ensure_ascii = False,
+                      indent = 4,
+                   sort_keys = True,
+            )
+
+        # Time how long it takes to load the GeoJSON ...
+        start = time.perf_counter()                                             # [s]
+        loadGeoJSON(
+            lname,
+                debug = debug,
+            onlyValid = True,
+               repair = True,
+        )
+        dur = time.perf_counter() - start                                       # [s]
+
+        print(f"      INFO: level {i + 1:d} ({lod:.4f}°) has {shapely.get_num_coordinates(multipolyLod):,d} coordinates, is {os.path.getsize(lname):,d} bytes and is {dur0 / max(dur, 1.0e-9):.1f}x faster to load")
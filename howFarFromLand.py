@@ -7,6 +7,7 @@ if __name__ == "__main__":
     import argparse
     import io
     import json
+    import math
     import os
     import pathlib
     import zipfile
@@ -91,6 +92,12 @@ if __name__ == "__main__":
     pad = 0.1                                                                   # [°]
     roi = 0.5                                                                   # [°]
 
+    # Set number of buffers, the distance of each buffer and hence the largest
+    # buffer distance (which are shared between all scripts) ...
+    nDist = hffl.nDist                                                          # [#]
+    stepDist = hffl.stepDist                                                    # [m]
+    maxDist = hffl.maxDist                                                      # [m]
+
     # Use mode to override number of bearings and degree of simplification (if
     # needed) ...
     if args.debug:
@@ -98,6 +105,11 @@ if __name__ == "__main__":
         res = "110m"
         simp = 0.1                                                              # [°]
 
+    # Set degrees of simplification for the levels of detail (only keeping
+    # those which are coarser than the full detail) ...
+    lods = [0.0002, 0.001, 0.005, 0.02]                                         # [°]
+    lods = [lod for lod in lods if lod > simp]                                  # [°]
+
     # Create short-hand for the colour map ...
     cmap = matplotlib.colormaps["turbo"]
 
@@ -147,6 +159,80 @@ if __name__ == "__main__":
 
     # **************************************************************************
 
+    # Define datasets (which are shared between all scripts) ...
+    dsets = hffl.dsets
+
+    # **************************************************************************
+
+    # Initialize dictionaries and lists ...
+    fingerprints = {}
+    hashes = {}
+    boxes = []
+    hashed = []
+
+    # Loop over datasets ...
+    for dset, dstub in dsets.items():
+        # Find the fingerprint of this version of the dataset ...
+        fingerprints[dset] = [os.path.getsize(dset), os.path.getmtime(dset)]   # [B], [s]
+
+        # Deduce JSON name and load the fingerprint and hashes of the previous
+        # version of the dataset (if it has been hashed before) ...
+        fname = f"{dset.removesuffix('.zip')}.json"
+        if os.path.exists(fname):
+            with open(fname, "rt", encoding = "utf-8") as fObj:
+                old = json.load(fObj)
+
+            # Convert a file from before fingerprints were saved (which only
+            # contains the hashes) ...
+            if "fingerprint" not in old:
+                old = {
+                    "fingerprint" : None,
+                        "records" : old,
+                }
+        else:
+            print(f"WARNING: \"{fname}\" is missing so any existing GeoJSON files are assumed to be from this version of \"{dset}\".")
+            old = None
+
+        # Skip this dataset if it is the same file as the previous version ...
+        if old is not None and old["fingerprint"] == fingerprints[dset]:
+            hashes[dset] = old["records"]
+            continue
+
+        print(f"Hashing \"{dset}\" ...")
+
+        # Load dataset ...
+        with zipfile.ZipFile(dset, "r") as zfObj:
+            # Read files into RAM so that they become seekable ...
+            # NOTE: https://stackoverflow.com/a/12025492
+            dbfObj = io.BytesIO(zfObj.read(f"{dstub}.dbf"))
+            shpObj = io.BytesIO(zfObj.read(f"{dstub}.shp"))
+            shxObj = io.BytesIO(zfObj.read(f"{dstub}.shx"))
+
+            # Open shapefile ...
+            sfObj = shapefile.Reader(dbf = dbfObj, shp = shpObj, shx = shxObj)
+
+            # Hash all records in the shapefile ...
+            hashes[dset] = hffl.hashShapefile(sfObj)
+            hashed.append(dset)
+
+        # Check if the dataset has been hashed before ...
+        if old is not None:
+            # Find the bounding boxes of all of the records which have changed
+            # between the previous version and this version of the dataset ...
+            boxes += hffl.changedBoxes(
+                old["records"],
+                hashes[dset],
+                debug = args.debug,
+            )
+
+    print(f"INFO: {len(boxes):,d} records have changed since the previous run")
+
+    # **************************************************************************
+
+    # Initialize lists ...
+    recomputed = []
+    reused = []
+
     # Define locations ...
     locs = [
         (51.268, -1.088, "Basingstoke Train Station", "basingstoke"),           # [°], [°]
@@ -162,11 +248,28 @@ if __name__ == "__main__":
         # Define bounding box ...
         xmin, xmax, ymin, ymax = x - roi, x + roi, y - roi, y + roi             # [°], [°], [°], [°]
 
+        # Find the size of the largest buffer distance in degrees (erring on the
+        # side of caution by using the latitude furthest from the equator) ...
+        dy = math.degrees(maxDist / 6371.0e3)                                   # [°]
+        dx = dy / math.cos(math.radians(max(abs(ymin), abs(ymax))))             # [°]
+
+        # Check if any of the changed records touch the area that this location
+        # depends on (widened by the largest buffer distance) ...
+        rebuild = False
+        for bxmin, bymin, bxmax, bymax in boxes:
+            if bxmin <= xmax + pad + dx and bxmax >= xmin - pad - dx:
+                if bymin <= ymax + pad + dy and bymax >= ymin - pad - dy:
+                    rebuild = True
+                    break
+
         # Deduce GeoJSON name and check what needs doing ...
         fname = f"{stub}.geojson"
-        if os.path.exists(fname):
+        if os.path.exists(fname) and not rebuild:
             print(f"  Loading \"{fname}\" ...")
 
+            # Append file to list ...
+            reused.append(fname)
+
             # Load GeoJSON ...
             multipoly = hffl.loadGeoJSON(
                 fname,
@@ -177,62 +280,31 @@ if __name__ == "__main__":
         else:
             print(f"  Saving \"{fname}\" ...")
 
+            # Append file to list and force all of the buffers of this location
+            # to be recomputed too ...
+            recomputed.append(fname)
+            rebuild = True
+
             # Initialize list ...
             polys = []
 
-            # ******************************************************************
-
-            print("    Loading \"alwaysOpen.zip\" ...")
-
-            # Load dataset ...
-            with zipfile.ZipFile("alwaysOpen.zip", "r") as zfObj:
-                # Read files into RAM so that they become seekable ...
-                # NOTE: https://stackoverflow.com/a/12025492
-                dbfObj = io.BytesIO(zfObj.read("d00dbcdd-ca42-4b51-9889-50627184f7602020313-1-1rdxbnd.c0er.dbf"))
-                shpObj = io.BytesIO(zfObj.read("d00dbcdd-ca42-4b51-9889-50627184f7602020313-1-1rdxbnd.c0er.shp"))
-                shxObj = io.BytesIO(zfObj.read("d00dbcdd-ca42-4b51-9889-50627184f7602020313-1-1rdxbnd.c0er.shx"))
-
-                # Open shapefile ...
-                sfObj = shapefile.Reader(dbf = dbfObj, shp = shpObj, shx = shxObj)
-
-                # Load all [Multi]Polygons from the shapefile ...
-                polys += hffl.loadShapefile(sfObj, xmin, xmax, ymin, ymax, pad, simp = simp)
-
-            # ******************************************************************
-
-            print("    Loading \"limitedAccess.zip\" ...")
-
-            # Load dataset ...
-            with zipfile.ZipFile("limitedAccess.zip", "r") as zfObj:
-                # Read files into RAM so that they become seekable ...
-                # NOTE: https://stackoverflow.com/a/12025492
-                dbfObj = io.BytesIO(zfObj.read("9a97e056-3bd9-4817-a9c5-ad7de1f31a1d2020313-1-rlrdj0.1jac.dbf"))
-                shpObj = io.BytesIO(zfObj.read("9a97e056-3bd9-4817-a9c5-ad7de1f31a1d2020313-1-rlrdj0.1jac.shp"))
-                shxObj = io.BytesIO(zfObj.read("9a97e056-3bd9-4817-a9c5-ad7de1f31a1d2020313-1-rlrdj0.1jac.shx"))
-
-                # Open shapefile ...
-                sfObj = shapefile.Reader(dbf = dbfObj, shp = shpObj, shx = shxObj)
+            # Loop over datasets ...
+            for dset, dstub in dsets.items():
+                print(f"    Loading \"{dset}\" ...")
 
-                # Load all [Multi]Polygons from the shapefile ...
-                polys += hffl.loadShapefile(sfObj, xmin, xmax, ymin, ymax, pad, simp = simp)
+                # Load dataset ...
+                with zipfile.ZipFile(dset, "r") as zfObj:
+                    # Read files into RAM so that they become seekable ...
+                    # NOTE: https://stackoverflow.com/a/12025492
+                    dbfObj = io.BytesIO(zfObj.read(f"{dstub}.dbf"))
+                    shpObj = io.BytesIO(zfObj.read(f"{dstub}.shp"))
+                    shxObj = io.BytesIO(zfObj.read(f"{dstub}.shx"))
 
-            # ******************************************************************
-
-            print("    Loading \"openAccess.zip\" ...")
-
-            # Load dataset ...
-            with zipfile.ZipFile("openAccess.zip", "r") as zfObj:
-                # Read files into RAM so that they become seekable ...
-                # NOTE: https://stackoverflow.com/a/12025492
-                dbfObj = io.BytesIO(zfObj.read("CRoW_Access_Land___Natural_England.dbf"))
-                shpObj = io.BytesIO(zfObj.read("CRoW_Access_Land___Natural_England.shp"))
-                shxObj = io.BytesIO(zfObj.read("CRoW_Access_Land___Natural_England.shx"))
-
-                # Open shapefile ...
-                sfObj = shapefile.Reader(dbf = dbfObj, shp = shpObj, shx = shxObj)
+                    # Open shapefile ...
+                    sfObj = shapefile.Reader(dbf = dbfObj, shp = shpObj, shx = shxObj)
 
-                # Load all [Multi]Polygons from the shapefile ...
-                polys += hffl.loadShapefile(sfObj, xmin, xmax, ymin, ymax, pad, simp = simp)
+                    # Load all [Multi]Polygons from the shapefile ...
+                    polys += hffl.loadShapefile(sfObj, xmin, xmax, ymin, ymax, pad, simp = simp)
 
             # ******************************************************************
 
@@ -252,6 +324,25 @@ if __name__ == "__main__":
                        sort_keys = True,
                 )
 
+        # Deduce GeoJSON names of the levels of detail and check what needs
+        # doing ...
+        lnames = hffl.levelNames(fname, lods)
+        if rebuild or not all(os.path.exists(lname) for lname in lnames):
+            print(f"  Saving levels of detail of \"{fname}\" ...")
+
+            # Append files to list ...
+            recomputed += lnames
+
+            # Save levels of detail ...
+            hffl.saveLevels(
+                fname,
+                lods,
+                debug = args.debug,
+            )
+        else:
+            # Append files to list ...
+            reused += lnames
+
         # **********************************************************************
 
         print("  Buffering data ...")
@@ -260,15 +351,18 @@ if __name__ == "__main__":
         dist = 0.0                                                              # [m]
 
         # Loop over distances ...
-        for i in range(6):
+        for i in range(nDist):
             # Increment distance ...
-            dist += 500.0                                                       # [m]
+            dist += stepDist                                                    # [m]
 
             # Deduce GeoJSON name and check what needs doing ...
             fname = f"{stub}{dist:04.0f}m.geojson"
-            if os.path.exists(fname):
+            if os.path.exists(fname) and not rebuild:
                 print(f"    Buffering for {0.001 * dist:.1f} km (loading \"{fname}\") ...")
 
+                # Append file to list ...
+                reused.append(fname)
+
                 # Load GeoJSON ...
                 multipoly = hffl.loadGeoJSON(
                     fname,
@@ -279,10 +373,15 @@ if __name__ == "__main__":
             else:
                 print(f"    Buffering for {0.001 * dist:.1f} km (saving \"{fname}\") ...")
 
+                # Append file to list and force all of the larger buffers of
+                # this location to be recomputed too ...
+                recomputed.append(fname)
+                rebuild = True
+
                 # Buffer MultiPolygon ...
                 multipoly = pyguymer3.geo.buffer(
                     multipoly,
-                    500.0,
+                    stepDist,
                     debug = args.debug,
                      nAng = nAng,
                      simp = simp,
@@ -298,6 +397,51 @@ if __name__ == "__main__":
                            sort_keys = True,
                     )
 
+            # Deduce GeoJSON names of the levels of detail and check what
+            # needs doing ...
+            lnames = hffl.levelNames(fname, lods)
+            if rebuild or not all(os.path.exists(lname) for lname in lnames):
+                print(f"      Saving levels of detail of \"{fname}\" ...")
+
+                # Append files to list ...
+                recomputed += lnames
+
+                # Save levels of detail ...
+                hffl.saveLevels(
+                    fname,
+                    lods,
+                    debug = args.debug,
+                )
+            else:
+                # Append files to list ...
+                reused += lnames
+
+    # **************************************************************************
+
+    # Loop over datasets which were hashed during this run ...
+    for dset in hashed:
+        # Save the fingerprint and hashes of this version of the dataset so that
+        # the next run can find which records have changed ...
+        with open(f"{dset.removesuffix('.zip')}.json", "wt", encoding = "utf-8") as fObj:
+            json.dump(
+                {
+                    "fingerprint" : fingerprints[dset],
+                        "records" : hashes[dset],
+                },
+                fObj,
+                ensure_ascii = False,
+                      indent = 4,
+                   sort_keys = True,
+            )
+
+    print("Rebuild report:")
+    print(f"  {len(recomputed):,d} GeoJSON files were recomputed:")
+    for fname in recomputed:
+        print(f"    \"{fname}\"")
+    print(f"  {len(reused):,d} GeoJSON files were reused:")
+    for fname in reused:
+        print(f"    \"{fname}\"")
+
     # NOTE: I break the loop here and do it again so that all of the GeoJSON
     #       file are made before any of the PNGs are made. This is because there
     #       is a bug in how "multiprocessing" works on newer versions of Mac OS
@@ -338,8 +482,13 @@ if __name__ == "__main__":
                        lon = x,
         )
 
+        # Find the size of a pixel in degrees (the field-of-view is 60 km across
+        # the width of the figure), which is the coarsest simplification that
+        # will not be visible ...
+        tol = math.degrees(2.0 * 30.0e3 / (fg.get_figwidth() * fg.get_dpi()) / 6371.0e3)   # [°]
+
         # Deduce GeoJSON name ...
-        fname = f"{stub}.geojson"
+        fname = hffl.chooseLevel(f"{stub}.geojson", lods, tol)
 
         # Load GeoJSON ...
         multipoly = hffl.loadGeoJSON(
@@ -380,12 +529,12 @@ if __name__ == "__main__":
         lines = []
 
         # Loop over distances ...
-        for i in range(6):
+        for i in range(nDist):
             # Increment distance ...
-            dist += 500.0                                                       # [m]
+            dist += stepDist                                                    # [m]
 
             # Deduce GeoJSON name ...
-            fname = f"{stub}{dist:04.0f}m.geojson"
+            fname = hffl.chooseLevel(f"{stub}{dist:04.0f}m.geojson", lods, tol)
 
             # Load GeoJSON ...
             multipoly = hffl.loadGeoJSON(
@@ -404,14 +553,14 @@ if __name__ == "__main__":
                 ),
                 cartopy.crs.PlateCarree(),
                     alpha = 1.0,
-                edgecolor = cmap(float(i) / 5.0),
+                edgecolor = cmap(float(i) / float(nDist - 1)),
                 facecolor = "none",
                 linewidth = 1.0,
             )
 
             # Add entries for the legend ...
             labels.append(f"{0.001 * dist:.1f} km")
-            lines.append(matplotlib.lines.Line2D([], [], color = cmap(float(i) / 5.0)))
+            lines.append(matplotlib.lines.Line2D([], [], color = cmap(float(i) / float(nDist - 1))))
 
         # Calculate the regrid shape based off the resolution and the size of
         # the figure, as well as a safety factor of 2 (remembering Nyquist) ...
@@ -420,16 +569,28 @@ if __name__ == "__main__":
             round(2.0 * fg.get_figheight() * fg.get_dpi()),
         )                                                                       # [px], [px]
 
-        # Draw background image ...
+        print("  Loading background ...")
+
+        # Crop and reproject the background image (or load it from the cache
+        # if it has been done before for this view and resolution) ...
+        img, extent = hffl.loadBackground(
+            ax,
+            f'OrdnanceSurveyBackgroundImages/{meta["MiniScale_(mono)_R22"]["greyscale"]}',
+            meta["MiniScale_(relief1)_R22"]["extent"],
+            stub,
+            regrid_shape = regrid_shape,
+        )
+
+        # Draw background image (which is already in the projection of the
+        # axis so Cartopy does not reproject it again) ...
         ax.imshow(
-            matplotlib.pyplot.imread(f'OrdnanceSurveyBackgroundImages/{meta["MiniScale_(mono)_R22"]["greyscale"]}'),
+            img,
                      cmap = "gray",
-                   extent = meta["MiniScale_(relief1)_R22"]["extent"],
+                   extent = extent,
             interpolation = "gaussian",
-                   origin = "upper",
-             regrid_shape = regrid_shape,
+                   origin = "lower",
                  resample = False,
-                transform = cartopy.crs.OSGB(),
+                transform = ax.projection,
                      vmax = 1.0,
                      vmin = 0.0,
         )